@@ -133,15 +133,13 @@ class ToolActivities:
         Returns a ValidationResult indicating if the prompt makes sense given the context.
         """
         # Create simple context string describing tools and goals
-        tools_description = []
-        for tool in validation_input.agent_goal.tools:
-            tool_str = f"Tool: {tool.name}\n"
-            tool_str += f"Description: {tool.description}\n"
-            tool_str += "Arguments: " + ", ".join(
-                [f"{arg.name} ({arg.type})" for arg in tool.arguments]
-            )
-            tools_description.append(tool_str)
-        tools_str = "\n".join(tools_description)
+        tools_str = "\n".join(
+            f"Tool: {tool.name}\n"
+            f"Description: {tool.description}\n"
+            "Arguments: "
+            + ", ".join(f"{arg.name} ({arg.type})" for arg in tool.arguments)
+            for tool in validation_input.agent_goal.tools
+        )
 
         # Convert conversation history to string
         history_str = json.dumps(validation_input.conversation_history, indent=2)
@@ -187,27 +185,10 @@ class ToolActivities:
 
     @activity.defn
     def agent_toolPlanner(self, input: ToolPromptInput) -> dict:
-        if self.llm_provider == "ollama":
-            return self.prompt_llm_ollama(input)
-        elif self.llm_provider == "google":
-            return self.prompt_llm_google(input)
-        elif self.llm_provider == "anthropic":
-            return self.prompt_llm_anthropic(input)
-        elif self.llm_provider == "deepseek":
-            return self.prompt_llm_deepseek(input)
-        else:
+        prompt_handler = self._LLM_PROMPT_HANDLERS.get(self.llm_provider)
+        if prompt_handler is None:
             return self.prompt_llm_openai(input)
-
-    def parse_json_response(self, response_content: str) -> dict:
-        """
-        Parses the JSON response content and returns it as a dictionary.
-        """
-        try:
-            data = json.loads(response_content)
-            return data
-        except json.JSONDecodeError as e:
-            print(f"Invalid JSON: {e}")
-            raise
+        return prompt_handler(self, input)
 
     def prompt_llm_openai(self, input: ToolPromptInput) -> dict:
         if not self.openai_client:
@@ -239,10 +220,7 @@ class ToolActivities:
         response_content = chat_completion.choices[0].message.content
         print(f"ChatGPT response: {response_content}")
 
-        # Use the new sanitize function
-        response_content = self.sanitize_json_response(response_content)
-
-        return self.parse_json_response(response_content)
+        return self.extract_json_response(response_content)
 
     def prompt_llm_ollama(self, input: ToolPromptInput) -> dict:
         # If not yet initialized, try to do so now (this is a backup if warm_up_ollama wasn't called or failed)
@@ -276,9 +254,7 @@ class ToolActivities:
             response: ChatResponse = chat(model=model_name, messages=messages)
             print(f"Chat response: {response.message.content}")
 
-            # Use the new sanitize function
-            response_content = self.sanitize_json_response(response.message.content)
-            return self.parse_json_response(response_content)
+            return self.extract_json_response(response.message.content)
         except (json.JSONDecodeError, ValueError) as e:
             # Re-raise JSON-related exceptions to let Temporal retry the activity
             print(f"JSON parsing error with Ollama response: {str(e)}")
@@ -309,10 +285,7 @@ class ToolActivities:
         response_content = response.text
         print(f"Google Gemini response: {response_content}")
 
-        # Use the new sanitize function
-        response_content = self.sanitize_json_response(response_content)
-
-        return self.parse_json_response(response_content)
+        return self.extract_json_response(response_content)
 
     def prompt_llm_anthropic(self, input: ToolPromptInput) -> dict:
         if not self.anthropic_client:
@@ -341,10 +314,7 @@ class ToolActivities:
         response_content = response.content[0].text
         print(f"Anthropic response: {response_content}")
 
-        # Use the new sanitize function
-        response_content = self.sanitize_json_response(response_content)
-
-        return self.parse_json_response(response_content)
+        return self.extract_json_response(response_content)
 
     def prompt_llm_deepseek(self, input: ToolPromptInput) -> dict:
         if not self.deepseek_client:
@@ -373,14 +343,22 @@ class ToolActivities:
         response_content = response
         print(f"DeepSeek response: {response_content}")
 
-        # Use the new sanitize function
-        response_content = self.sanitize_json_response(response_content)
+        return self.extract_json_response(response_content)
 
-        return self.parse_json_response(response_content)
+    # Maps LLM_PROVIDER values to their prompt implementations. Unknown
+    # providers fall back to OpenAI, matching the warning in __init__.
+    _LLM_PROMPT_HANDLERS = {
+        "openai": prompt_llm_openai,
+        "ollama": prompt_llm_ollama,
+        "google": prompt_llm_google,
+        "anthropic": prompt_llm_anthropic,
+        "deepseek": prompt_llm_deepseek,
+    }
 
-    def sanitize_json_response(self, response_content: str) -> str:
+    def extract_json_response(self, response_content: str) -> dict:
         """
-        Extracts the JSON block from the response content as a string.
+        Extracts the JSON block from the response content and parses it in a
+        single pass, returning it as a dictionary.
         Supports:
         - JSON surrounded by ```json and ```
         - Raw JSON input
@@ -408,10 +386,9 @@ class ToolActivities:
                 if json_start != -1 and json_end != -1 and json_start < json_end:
                     json_str = response_content[json_start : json_end + 1].strip()
 
-            # Validate and ensure the extracted JSON is valid
+            # Parse the extracted JSON once; raises if it is invalid
             if json_str:
-                json.loads(json_str)  # This will raise an error if the JSON is invalid
-                return json_str
+                return json.loads(json_str)
 
             # If no valid JSON found, raise an error
             raise ValueError("Response does not contain valid JSON.")
@@ -438,16 +415,24 @@ def get_current_date_human_readable():
     return datetime.now().strftime("%A, %B %d, %Y")
 
 
+# Cached reference to tools.get_handler. The import stays out of module scope
+# so the tool implementations (stripe, requests, ...) are only loaded inside
+# the activity worker, but it now runs once instead of on every invocation.
+_get_handler = None
+
+
 @activity.defn(dynamic=True)
 def dynamic_tool_activity(args: Sequence[RawValue]) -> dict:
-    from tools import get_handler
+    global _get_handler
+    if _get_handler is None:
+        from tools import get_handler as _get_handler
 
     tool_name = activity.info().activity_type  # e.g. "FindEvents"
     tool_args = activity.payload_converter().from_payload(args[0].payload, dict)
     activity.logger.info(f"Running dynamic tool '{tool_name}' with args: {tool_args}")
 
     # Delegate to the relevant function
-    handler = get_handler(tool_name)
+    handler = _get_handler(tool_name)
     result = handler(tool_args)
 
     # Optionally log or augment the result
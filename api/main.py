@@ -10,25 +10,37 @@ import os
 
 from workflows.agent_goal_workflow import AgentGoalWorkflow
 from models.data_types import CombinedInput, AgentGoalWorkflowParams
-from tools.goal_registry import goal_match_train_invoice, goal_event_flight_invoice
+from tools.goal_registry import goal_match_train_invoice
+from tools.goal_registry_legacy import goal_event_flight_invoice
 from fastapi.middleware.cors import CORSMiddleware
 from shared.config import get_temporal_client, TEMPORAL_TASK_QUEUE
 
 app = FastAPI()
 temporal_client: Optional[Client] = None
 
+# Workflow states treated as failed when fetching conversation history.
+FAILED_WORKFLOW_STATES = (
+    WorkflowExecutionStatus.WORKFLOW_EXECUTION_STATUS_TERMINATED,
+    WorkflowExecutionStatus.WORKFLOW_EXECUTION_STATUS_CANCELED,
+    WorkflowExecutionStatus.WORKFLOW_EXECUTION_STATUS_FAILED,
+)
+
 # Load environment variables
 load_dotenv()
 
 
+# Registry of goals selectable via the AGENT_GOAL environment variable,
+# built once at import instead of on every request.
+GOALS_BY_NAME = {
+    "goal_match_train_invoice": goal_match_train_invoice,
+    "goal_event_flight_invoice": goal_event_flight_invoice,
+}
+
+
 def get_agent_goal():
     """Get the agent goal from environment variables."""
     goal_name = os.getenv("AGENT_GOAL", "goal_match_train_invoice")
-    goals = {
-        "goal_match_train_invoice": goal_match_train_invoice,
-        "goal_event_flight_invoice": goal_event_flight_invoice,
-    }
-    return goals.get(goal_name, goal_event_flight_invoice)
+    return GOALS_BY_NAME.get(goal_name, goal_event_flight_invoice)
 
 
 @app.on_event("startup")
@@ -79,14 +91,8 @@ async def get_conversation_history():
     try:
         handle = temporal_client.get_workflow_handle("agent-workflow")
 
-        failed_states = [
-            WorkflowExecutionStatus.WORKFLOW_EXECUTION_STATUS_TERMINATED,
-            WorkflowExecutionStatus.WORKFLOW_EXECUTION_STATUS_CANCELED,
-            WorkflowExecutionStatus.WORKFLOW_EXECUTION_STATUS_FAILED,
-        ]
-
         description = await handle.describe()
-        if description.status in failed_states:
+        if description.status in FAILED_WORKFLOW_STATES:
             print("Workflow is in a failed state. Returning empty history.")
             return []
 
@@ -2,6 +2,35 @@ from models.tool_definitions import AgentGoal
 from typing import Optional
 import json
 
+# Static sections of the GenAI prompt, assembled once at import.
+AGENT_ROLE_INTRO = (
+    "You are an AI agent that helps fill required arguments for the tools described below. "
+    "You must respond with valid JSON ONLY, using the schema provided in the instructions."
+)
+
+JSON_FORMAT_INSTRUCTIONS = (
+    "Your JSON format must be:\n"
+    "{\n"
+    '  "response": "<plain text>",\n'
+    '  "next": "<question|confirm|done>",\n'
+    '  "tool": "<tool_name or null>",\n'
+    '  "args": {\n'
+    '    "<arg1>": "<value1 or null>",\n'
+    '    "<arg2>": "<value2 or null>",\n'
+    "    ...\n"
+    "  }\n"
+    "}"
+)
+
+JSON_GENERATION_RULES = (
+    "1) If any required argument is missing, set next='question' and ask the user.\n"
+    "2) If all required arguments are known, set next='confirm' and specify the tool.\n"
+    "   The user will confirm before the tool is run.\n"
+    "3) If no more tools are needed (user_confirmed_tool_run has been run for all), set next='done' and tool=null.\n"
+    "4) response should be short and user-friendly.\n"
+    "5) Don't set next='done' until the final tool has returned user_confirmed_tool_run.\n"
+)
+
 
 def generate_genai_prompt(
     agent_goal: AgentGoal, conversation_history: str, raw_json: Optional[str] = None
@@ -13,10 +42,7 @@ def generate_genai_prompt(
     prompt_lines = []
 
     # Intro / Role
-    prompt_lines.append(
-        "You are an AI agent that helps fill required arguments for the tools described below. "
-        "You must respond with valid JSON ONLY, using the schema provided in the instructions."
-    )
+    prompt_lines.append(AGENT_ROLE_INTRO)
 
     # Main Conversation History
     prompt_lines.append("=== Conversation History ===")
@@ -64,27 +90,8 @@ def generate_genai_prompt(
 
     # JSON Format Instructions
     prompt_lines.append("=== Instructions for JSON Generation ===")
-    prompt_lines.append(
-        "Your JSON format must be:\n"
-        "{\n"
-        '  "response": "<plain text>",\n'
-        '  "next": "<question|confirm|done>",\n'
-        '  "tool": "<tool_name or null>",\n'
-        '  "args": {\n'
-        '    "<arg1>": "<value1 or null>",\n'
-        '    "<arg2>": "<value2 or null>",\n'
-        "    ...\n"
-        "  }\n"
-        "}"
-    )
-    prompt_lines.append(
-        "1) If any required argument is missing, set next='question' and ask the user.\n"
-        "2) If all required arguments are known, set next='confirm' and specify the tool.\n"
-        "   The user will confirm before the tool is run.\n"
-        "3) If no more tools are needed (user_confirmed_tool_run has been run for all), set next='done' and tool=null.\n"
-        "4) response should be short and user-friendly.\n"
-        "5) Don't set next='done' until the final tool has returned user_confirmed_tool_run.\n"
-    )
+    prompt_lines.append(JSON_FORMAT_INSTRUCTIONS)
+    prompt_lines.append(JSON_GENERATION_RULES)
 
     # Validation Task (If raw_json is provided)
     if raw_json is not None:
@@ -3,7 +3,13 @@ from urllib.parse import parse_qs, urlparse
 import json
 import time
 import random
-import string
+
+DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M",  # e.g. "2025-04-18T09:00"
+    "%Y-%m-%dT%H:%M:%S",  # e.g. "2025-04-18T09:00:00"
+    "%Y-%m-%d %H:%M:%S",  # e.g. "2025-04-18 09:00:00"
+    "%Y-%m-%d",  # e.g. "2025-04-11"
+)
 
 
 def parse_datetime(datetime_str):
@@ -11,14 +17,7 @@ def parse_datetime(datetime_str):
     if datetime_str.endswith("Z"):
         datetime_str = datetime_str[:-1]
 
-    formats = [
-        "%Y-%m-%dT%H:%M",  # e.g. "2025-04-18T09:00"
-        "%Y-%m-%dT%H:%M:%S",  # e.g. "2025-04-18T09:00:00"
-        "%Y-%m-%d %H:%M:%S",  # e.g. "2025-04-18 09:00:00"
-        "%Y-%m-%d",  # e.g. "2025-04-11"
-    ]
-
-    for fmt in formats:
+    for fmt in DATETIME_FORMATS:
         try:
             parsed = time.strptime(datetime_str, fmt)
             if fmt == "%Y-%m-%d":
@@ -40,16 +39,25 @@ def parse_datetime(datetime_str):
 
 class TrainServer(BaseHTTPRequestHandler):
     def generate_journeys(self, origin, destination, out_datetime, ret_datetime):
-        journeys = []
+        journeys = self.generate_leg_journeys(
+            "outbound", origin, destination, out_datetime
+        )
+
+        # Generate return journeys if return datetime provided
+        if ret_datetime[0] is not None:
+            journeys += self.generate_leg_journeys(
+                "return", destination, origin, ret_datetime
+            )
+
+        return journeys
 
+    def generate_leg_journeys(self, journey_type, departure, arrival, leg_datetime):
         # Helper to format datetime
         def format_datetime(year, month, day, hour, minute):
-            return "{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}".format(
-                year=year, month=month, day=day, hour=hour, minute=minute
-            )
+            return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}"
 
-        # Generate outbound journeys
-        year, month, day, hour, minute = out_datetime
+        journeys = []
+        year, month, day, hour, minute = leg_datetime
         for offset in [-30, 0, 30]:
             # Calculate journey times
             adj_minutes = minute + offset
@@ -62,16 +70,16 @@ class TrainServer(BaseHTTPRequestHandler):
 
             # Journey takes 2h15m-2h45m (135-165 minutes)
             duration = 135 + random.randint(0, 30)
-            arr_hour = adj_hour + (duration // 60)
-            arr_minute = (adj_minute + (duration % 60)) % 60
+            carry, arr_minute = divmod(adj_minute + duration % 60, 60)
+            arr_hour = adj_hour + duration // 60 + carry
             arr_day = adj_day + (arr_hour // 24)
             arr_hour = arr_hour % 24
 
             journey = {
                 "id": "T{}".format(random.randint(1000, 9999)),
-                "type": "outbound",
-                "departure": origin,
-                "arrival": destination,
+                "type": journey_type,
+                "departure": departure,
+                "arrival": arrival,
                 "departure_time": format_datetime(
                     year, month, adj_day, adj_hour, adj_minute
                 ),
@@ -82,39 +90,6 @@ class TrainServer(BaseHTTPRequestHandler):
             }
             journeys.append(journey)
 
-        # Generate return journeys if return datetime provided
-        if ret_datetime[0] is not None:
-            year, month, day, hour, minute = ret_datetime
-            for offset in [-30, 0, 30]:
-                adj_minutes = minute + offset
-                adj_hour = hour + (adj_minutes // 60)
-                adj_minute = adj_minutes % 60
-
-                adj_day = day + (adj_hour // 24)
-                adj_hour = adj_hour % 24
-
-                # Journey takes 2h15m-2h45m (135-165 minutes)
-                duration = 135 + random.randint(0, 30)
-                arr_hour = adj_hour + (duration // 60)
-                arr_minute = (adj_minute + (duration % 60)) % 60
-                arr_day = adj_day + (arr_hour // 24)
-                arr_hour = arr_hour % 24
-
-                journey = {
-                    "id": "T{}".format(random.randint(1000, 9999)),
-                    "type": "return",
-                    "departure": destination,
-                    "arrival": origin,
-                    "departure_time": format_datetime(
-                        year, month, adj_day, adj_hour, adj_minute
-                    ),
-                    "arrival_time": format_datetime(
-                        year, month, arr_day, arr_hour, arr_minute
-                    ),
-                    "price": round(30 + random.random() * 50, 2),
-                }
-                journeys.append(journey)
-
         return journeys
 
     def do_GET(self):
@@ -187,9 +162,7 @@ class TrainServer(BaseHTTPRequestHandler):
             self.send_header("Content-Type", "application/json")
             self.end_headers()
 
-            booking_ref = "BR" + "".join(
-                [random.choice(string.digits) for _ in range(5)]
-            )
+            booking_ref = "BR{:05d}".format(random.randrange(100000))
 
             response = json.dumps(
                 {
@@ -213,4 +186,4 @@ def run_server():
 
 
 if __name__ == "__main__":
-    run_server()
\ No newline at end of file
+    run_server()
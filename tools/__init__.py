@@ -5,19 +5,19 @@ from .search_trains import book_trains
 from .create_invoice import create_invoice
 from .find_events import find_events
 
+# Maps tool names (as used by the agent and Temporal activities) to handlers.
+TOOL_HANDLERS = {
+    "SearchFixtures": search_fixtures,
+    "SearchFlights": search_flights,
+    "SearchTrains": search_trains,
+    "BookTrains": book_trains,
+    "CreateInvoice": create_invoice,
+    "FindEvents": find_events,
+}
 
-def get_handler(tool_name: str):
-    if tool_name == "SearchFixtures":
-        return search_fixtures
-    if tool_name == "SearchFlights":
-        return search_flights
-    if tool_name == "SearchTrains":
-        return search_trains
-    if tool_name == "BookTrains":
-        return book_trains
-    if tool_name == "CreateInvoice":
-        return create_invoice
-    if tool_name == "FindEvents":
-        return find_events
 
-    raise ValueError(f"Unknown tool: {tool_name}")
+def get_handler(tool_name: str):
+    handler = TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {tool_name}")
+    return handler
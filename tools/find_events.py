@@ -1,14 +1,30 @@
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import json
 
+DATA_FILE_PATH = Path(__file__).resolve().parent / "data" / "find_events_data.json"
+
+
+@lru_cache(maxsize=1)
+def _load_events_data() -> tuple:
+    """Parse the static events data file once and reuse it across calls.
+
+    Returns (city_name, lowercased_city_name, events) triples so the per-call
+    city filter doesn't have to re-lowercase every city name.
+    """
+    with open(DATA_FILE_PATH) as f:
+        data = json.load(f)
+    return tuple(
+        (city_name, city_name.lower(), events) for city_name, events in data.items()
+    )
+
 
 def find_events(args: dict) -> dict:
     search_city = args.get("city", "").lower()
     search_month = args.get("month", "").capitalize()
 
-    file_path = Path(__file__).resolve().parent / "data" / "find_events_data.json"
-    if not file_path.exists():
+    if not DATA_FILE_PATH.exists():
         return {"error": "Data file not found."}
 
     try:
@@ -24,9 +40,17 @@ def find_events(args: dict) -> dict:
 
     valid_months = get_adjacent_months(month_number)
 
+    # Month-to-label table, in priority order: the requested month wins over
+    # its neighbours when an event spans more than one of them.
+    month_labels = {
+        month_number: "requested month",
+        valid_months[0]: "previous month",
+        valid_months[2]: "next month",
+    }
+
     matching_events = []
-    for city_name, events in json.load(open(file_path)).items():
-        if search_city and search_city not in city_name.lower():
+    for city_name, city_name_lower, events in _load_events_data():
+        if search_city and search_city not in city_name_lower:
             continue
 
         for event in events:
@@ -34,17 +58,14 @@ def find_events(args: dict) -> dict:
             date_to = datetime.strptime(event["dateTo"], "%Y-%m-%d")
 
             # If the event's start or end month is in our valid months
+            event_months = (date_from.month, date_to.month)
             if date_from.month in valid_months or date_to.month in valid_months:
                 # Add metadata explaining how it matches
-                if date_from.month == month_number or date_to.month == month_number:
-                    month_context = "requested month"
-                elif (
-                    date_from.month == valid_months[0]
-                    or date_to.month == valid_months[0]
-                ):
-                    month_context = "previous month"
-                else:
-                    month_context = "next month"
+                month_context = next(
+                    label
+                    for month, label in month_labels.items()
+                    if month in event_months
+                )
 
                 matching_events.append(
                     {
@@ -1,13 +1,32 @@
 import os
+import re
 import requests
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+load_dotenv(override=True)
+
 BASE_URL = "https://api.football-data.org/v4"
 
+# strptime alone also accepts non-zero-padded dates (e.g. "2025-4-8"), so pin
+# the padded form too before reusing the raw strings in the fixtures URL.
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Pool of opponents for the example fixture generator, shared across calls.
+EXAMPLE_OPPONENTS = (
+    "Manchester United FC",
+    "Leicester City FC",
+    "Manchester City FC",
+    "Liverpool FC",
+    "Chelsea FC",
+    "Arsenal FC",
+    "Tottenham Hotspur FC",
+    "West Ham United FC",
+    "Everton FC",
+)
+
 
 def search_fixtures(args: dict) -> dict:
-    load_dotenv(override=True)
     api_key = os.getenv("FOOTBALL_DATA_API_KEY", "YOUR_DEFAULT_KEY")
 
     team_name = args.get("team")
@@ -17,12 +36,18 @@ def search_fixtures(args: dict) -> dict:
     team_name = team_name.lower()
 
     try:
-        date_from = datetime.strptime(date_from_str, "%Y-%m-%d")
-        date_to = datetime.strptime(date_to_str, "%Y-%m-%d")
+        datetime.strptime(date_from_str, "%Y-%m-%d")
+        datetime.strptime(date_to_str, "%Y-%m-%d")
     except ValueError:
         return {
             "error": "Invalid date provided. Expected format YYYY-MM-DD for both date_from and date_to."
         }
+    if not (
+        DATE_PATTERN.fullmatch(date_from_str) and DATE_PATTERN.fullmatch(date_to_str)
+    ):
+        return {
+            "error": "Invalid date provided. Expected format YYYY-MM-DD for both date_from and date_to."
+        }
 
     # Fetch team ID
     teams_response = requests.get(f"{BASE_URL}/competitions/PL/teams", headers=headers)
@@ -39,9 +64,8 @@ def search_fixtures(args: dict) -> dict:
     if not team_id:
         return {"error": "Team not found."}
 
-    date_from_formatted = date_from.strftime("%Y-%m-%d")
-    date_to_formatted = date_to.strftime("%Y-%m-%d")
-    fixtures_url = f"{BASE_URL}/teams/{team_id}/matches?dateFrom={date_from_formatted}&dateTo={date_to_formatted}"
+    # Validation above guarantees the zero-padded form, so reuse the strings as-is.
+    fixtures_url = f"{BASE_URL}/teams/{team_id}/matches?dateFrom={date_from_str}&dateTo={date_to_str}"
     print(fixtures_url)
 
     fixtures_response = requests.get(fixtures_url, headers=headers)
@@ -109,22 +133,10 @@ def search_fixtures_example(args: dict) -> dict:
     # Ensure we only have 3 dates
     fixture_dates = fixture_dates[:3]
 
-    # Expanded pool of opponent teams to avoid team playing against itself
-    all_opponents = [
-        "Manchester United FC",
-        "Leicester City FC",
-        "Manchester City FC",
-        "Liverpool FC",
-        "Chelsea FC",
-        "Arsenal FC",
-        "Tottenham Hotspur FC",
-        "West Ham United FC",
-        "Everton FC",
-    ]
-
     # Select opponents that aren't the same as the requested team
+    team_name_lower = team_name.lower()
     available_opponents = [
-        team for team in all_opponents if team.lower() != team_name.lower()
+        team for team in EXAMPLE_OPPONENTS if team.lower() != team_name_lower
     ]
 
     # Ensure we have at least 3 opponents
@@ -4,12 +4,13 @@ import http.client
 from dotenv import load_dotenv
 import urllib.parse
 
+load_dotenv(override=True)
+
 
 def search_airport(query: str) -> list:
     """
     Returns a list of matching airports/cities from sky-scrapper's searchAirport endpoint.
     """
-    load_dotenv(override=True)
     api_key = os.getenv("RAPIDAPI_KEY", "YOUR_DEFAULT_KEY")
     api_host = os.getenv("RAPIDAPI_HOST", "sky-scrapper.p.rapidapi.com")
 
@@ -71,7 +72,6 @@ def search_flights_real_api(
     dest_entity_id = dest_params["entityId"]  # e.g. "27537542"
 
     # Step 2: Call flight search with resolved codes
-    load_dotenv(override=True)
     api_key = os.getenv("RAPIDAPI_KEY", "YOUR_DEFAULT_KEY")
     api_host = os.getenv("RAPIDAPI_HOST", "sky-scrapper.p.rapidapi.com")
 
@@ -122,12 +122,9 @@ def search_flights_real_api(
             return_flight = return_leg.get("segments", [{}])[0]
 
             # Extract flight details
-            outbound_carrier = outbound_flight.get("operatingCarrier", {}).get(
-                "name", "N/A"
-            )
-            outbound_carrier_code = outbound_flight.get("operatingCarrier", {}).get(
-                "alternateId", ""
-            )
+            outbound_carrier_info = outbound_flight.get("operatingCarrier", {})
+            outbound_carrier = outbound_carrier_info.get("name", "N/A")
+            outbound_carrier_code = outbound_carrier_info.get("alternateId", "")
             outbound_flight_number = outbound_flight.get("flightNumber", "N/A")
             outbound_flight_code = (
                 f"{outbound_carrier_code}{outbound_flight_number}"
@@ -135,12 +132,9 @@ def search_flights_real_api(
                 else outbound_flight_number
             )
 
-            return_carrier = return_flight.get("operatingCarrier", {}).get(
-                "name", "N/A"
-            )
-            return_carrier_code = return_flight.get("operatingCarrier", {}).get(
-                "alternateId", ""
-            )
+            return_carrier_info = return_flight.get("operatingCarrier", {})
+            return_carrier = return_carrier_info.get("name", "N/A")
+            return_carrier_code = return_carrier_info.get("alternateId", "")
             return_flight_number = return_flight.get("flightNumber", "N/A")
             return_flight_code = (
                 f"{return_carrier_code}{return_flight_number}"
@@ -173,6 +167,40 @@ def search_flights_real_api(
     }
 
 
+# Static example results shared by every search_flights call; built once at
+# import. Callers treat the payload as read-only.
+EXAMPLE_FLIGHT_RESULTS = [
+    {
+        "operating_carrier": "American Airlines",
+        "outbound_flight_code": "AA203",
+        "price": 1262.51,
+        "return_flight_code": "AA202",
+        "return_operating_carrier": "American Airlines",
+    },
+    {
+        "operating_carrier": "Air New Zealand",
+        "outbound_flight_code": "NZ488",
+        "price": 1396.00,
+        "return_flight_code": "NZ527",
+        "return_operating_carrier": "Air New Zealand",
+    },
+    {
+        "operating_carrier": "United Airlines",
+        "outbound_flight_code": "UA100",
+        "price": 1500.00,
+        "return_flight_code": "UA101",
+        "return_operating_carrier": "United Airlines",
+    },
+    {
+        "operating_carrier": "Delta Airlines",
+        "outbound_flight_code": "DL200",
+        "price": 1600.00,
+        "return_flight_code": "DL201",
+        "return_operating_carrier": "Delta Airlines",
+    },
+]
+
+
 def search_flights(args: dict) -> dict:
     """
     Returns example flight search results in the requested JSON format.
@@ -184,34 +212,5 @@ def search_flights(args: dict) -> dict:
         "currency": "USD",
         "destination": f"{destination}",
         "origin": f"{origin}",
-        "results": [
-            {
-                "operating_carrier": "American Airlines",
-                "outbound_flight_code": "AA203",
-                "price": 1262.51,
-                "return_flight_code": "AA202",
-                "return_operating_carrier": "American Airlines",
-            },
-            {
-                "operating_carrier": "Air New Zealand",
-                "outbound_flight_code": "NZ488",
-                "price": 1396.00,
-                "return_flight_code": "NZ527",
-                "return_operating_carrier": "Air New Zealand",
-            },
-            {
-                "operating_carrier": "United Airlines",
-                "outbound_flight_code": "UA100",
-                "price": 1500.00,
-                "return_flight_code": "UA101",
-                "return_operating_carrier": "United Airlines",
-            },
-            {
-                "operating_carrier": "Delta Airlines",
-                "outbound_flight_code": "DL200",
-                "price": 1600.00,
-                "return_flight_code": "DL201",
-                "return_operating_carrier": "Delta Airlines",
-            },
-        ],
+        "results": EXAMPLE_FLIGHT_RESULTS,
     }
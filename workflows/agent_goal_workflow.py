@@ -1,3 +1,4 @@
+import logging
 from collections import deque
 from datetime import timedelta
 from typing import Dict, Any, Union, List, Optional, Deque, TypedDict
@@ -203,11 +204,9 @@ class AgentGoalWorkflow:
             actor: The entity that generated the message (e.g., "user", "agent")
             response: The message content, either as a string or structured data
         """
-        if isinstance(response, dict):
-            response_str = str(response)
+        if workflow.logger.isEnabledFor(logging.DEBUG):
+            response_str = str(response) if isinstance(response, dict) else response
             workflow.logger.debug(f"Adding {actor} message: {response_str[:100]}...")
-        else:
-            workflow.logger.debug(f"Adding {actor} message: {response[:100]}...")
 
         self.conversation_history["messages"].append(
             {"actor": actor, "response": response}
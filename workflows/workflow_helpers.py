@@ -17,6 +17,9 @@ TOOL_ACTIVITY_SCHEDULE_TO_CLOSE_TIMEOUT = timedelta(minutes=30)
 LLM_ACTIVITY_START_TO_CLOSE_TIMEOUT = timedelta(seconds=20)
 LLM_ACTIVITY_SCHEDULE_TO_CLOSE_TIMEOUT = timedelta(minutes=30)
 
+# Tools served by the legacy (.NET) worker on its own task queue.
+LEGACY_TASK_QUEUE_TOOLS = frozenset({"SearchTrains", "BookTrains"})
+
 
 async def handle_tool_execution(
     current_tool: str,
@@ -29,9 +32,7 @@ async def handle_tool_execution(
     workflow.logger.info(f"Confirmed. Proceeding with tool: {current_tool}")
 
     task_queue = (
-        TEMPORAL_LEGACY_TASK_QUEUE
-        if current_tool in ["SearchTrains", "BookTrains"]
-        else None
+        TEMPORAL_LEGACY_TASK_QUEUE if current_tool in LEGACY_TASK_QUEUE_TOOLS else None
     )
 
     try: